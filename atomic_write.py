@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+import contextlib
+import os
+
+
+def atomic_write(path, data):
+    """
+    Write data (str or bytes) to path atomically: it goes to path + ".tmp",
+    which is opened normally so it gets the usual umask permissions, and is
+    then moved into place with os.replace. The temp file is removed if any
+    step fails.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        if isinstance(data, bytes):
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+        else:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
@@ -1,23 +1,58 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import collections
 import concurrent.futures
+import contextlib
+import functools
+import itertools
 import logging
 import os
+import re
 import sys
 import json
+import random
+import socket
+import sqlite3
 import time
+from urllib.parse import urlsplit
+import aiohttp
+from aiohttp.abc import AbstractResolver
+import idna
 import whois  # Requires python-whois; supports many TLDs.
+
+try:
+    from whois.exceptions import (
+        PywhoisError,
+        WhoisCommandFailedError,
+        WhoisQuotaExceededError,
+    )
+
+    # Errors that mean the lookup itself failed, not that the domain is free.
+    WHOIS_FAILURES = (WhoisCommandFailedError, WhoisQuotaExceededError)
+except ImportError:  # python-whois < 0.9 only raises the base parser error
+    from whois.parser import PywhoisError
+
+    WHOIS_FAILURES = ()
 import requests
+from requests.adapters import HTTPAdapter
 import smtplib
 import ssl
 from email.mime.text import MIMEText
-from threading import Lock
+
+from atomic_write import atomic_write
+
+# Matches "${VAR}" or "${VAR:-default}" config values.
+ENV_VAR_PATTERN = re.compile(
+    r"\A\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-(.*))?\}\Z", re.DOTALL
+)
 
 
 def load_config():
     """
     Load configuration from config.json and resolve any environment variable placeholders.
-    For any string value of the form "${VAR}", substitute it with the value of the environment variable VAR.
+    For any string value of the form "${VAR}", substitute it with the value of the environment variable VAR;
+    "${VAR:-default}" falls back to default when VAR is unset or empty.
     """
     try:
         with open("config.json") as f:
@@ -25,21 +60,26 @@ def load_config():
     except Exception as e:
         sys.exit(f"Error loading config.json: {e}")
 
-    def resolve(item):
-        if isinstance(item, dict):
-            return {k: resolve(v) for k, v in item.items()}
-        elif isinstance(item, list):
-            return [resolve(x) for x in item]
-        elif isinstance(item, str):
-            # If the string is in the form "${VAR}", attempt to resolve it.
-            if item.startswith("${") and item.endswith("}"):
-                env_var = item[2:-1]
-                return os.environ.get(env_var, item)
-            return item
-        else:
-            return item
-
-    return resolve(config)
+    # Walk the tree with an explicit stack, substituting string leaves in place.
+    # JSON only yields exact built-in types, so nodes dispatch on type() with a
+    # dict probe rather than isinstance() checks.
+    children = {dict: dict.items, list: enumerate}
+    stack = [config] if type(config) in children else []
+    while stack:
+        node = stack.pop()
+        for key, value in children[type(node)](node):
+            kind = type(value)
+            if kind is str:
+                match = ENV_VAR_PATTERN.match(value)
+                if match:
+                    name, default = match.groups()
+                    if default is None:
+                        node[key] = os.environ.get(name, value)
+                    else:
+                        node[key] = os.environ.get(name) or default
+            elif kind in children:
+                stack.append(value)
+    return config
 
 
 # Load configuration (with environment variable resolution)
@@ -47,6 +87,22 @@ config = load_config()
 
 THREAD_COUNT = config.get("thread_count", 10)
 CHECK_TIMEOUT = config.get("check_timeout", 10)
+# Number of domains scheduled on the event loop at once (bounds memory).
+CHECK_BATCH_SIZE = config.get("check_batch_size", 1000)
+# Connection pool limits for the shared RDAP/Domainr HTTP session.
+MAX_CONNECTIONS = config.get("max_connections", 500)
+MAX_CONNECTIONS_PER_HOST = config.get("max_connections_per_host", 20)
+# In-flight RDAP lookups across all registries; each registry host is limited
+# by max_connections_per_host and each TLD by tld_concurrency. WHOIS gets a
+# small dedicated pool of thread_count // 2.
+RDAP_CONCURRENCY = config.get("rdap_concurrency", 200)
+# In-flight lookups per TLD, so no single registry is flooded.
+TLD_CONCURRENCY = config.get("tld_concurrency", 8)
+WHOIS_WORKERS = max(THREAD_COUNT // 2, 1)
+# Availability cache TTLs in seconds; each entry's TTL is jittered by +/-10%.
+CACHE_TTL_TAKEN = config.get("cache_ttl_taken", 86400)
+CACHE_TTL_AVAILABLE = config.get("cache_ttl_available", 3600)
+CACHE_TTL_JITTER = 0.1
 DOMAINR_API_TYPE = config.get("domainr_api_type", "rapidapi")
 # Split the API keys string by comma if provided.
 DOMAINR_API_KEYS = (
@@ -54,6 +110,15 @@ DOMAINR_API_KEYS = (
     if config.get("domainr_api_keys")
     else []
 )
+# Domainr request rate (token bucket) and retry policy for 429/5xx responses.
+DOMAINR_RATE_LIMIT = config.get("domainr_rate_limit", 10)
+if DOMAINR_RATE_LIMIT <= 0:
+    sys.exit("Error in config.json: domainr_rate_limit must be greater than 0")
+DOMAINR_MAX_RETRIES = config.get("domainr_max_retries", 5)
+# Domains per Domainr request when coalescing fallback lookups (API max is 10).
+DOMAINR_BATCH_SIZE = config.get("domainr_batch_size", 10)
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30
 
 # Set up logging with fallback to console if file access fails
 os.makedirs("logs", exist_ok=True)
@@ -63,6 +128,10 @@ try:
     handlers.append(logging.FileHandler(LOG_FILE))
 except PermissionError as e:
     print(f"Warning: Unable to open log file {LOG_FILE}: {e}")
+# The log format uses no thread or process fields, so skip collecting them.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
@@ -70,8 +139,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+RDAP_URL = "https://rdap.org/domain/{}"
+RDAP_BOOTSTRAP_URL = "https://data.iana.org/rdap/dns.json"
+
 OUTPUT_FILE = "output/available_domains.txt"
 STATUS_FILE = "output/domain_status.json"  # stores previous run statuses
+CACHE_FILE = "output/cache.db"  # TTL-bounded availability cache
 
 # Email/Webhook settings
 ENABLE_EMAIL = config.get("enable_email", False)
@@ -84,18 +157,28 @@ EMAIL_TO = config.get("email_to", "")
 ENABLE_WEBHOOK = config.get("enable_webhook", False)
 WEBHOOK_URL = config.get("webhook_url", "")
 
-api_key_lock = Lock()
-DOMAINR_API_KEY_INDEX = 0
+# Shared keep-alive session for synchronous HTTP calls (webhook notifications);
+# asynchronous lookups share the pooled aiohttp session in check_all_domains().
+http_session = requests.Session()
+http_session.headers["Connection"] = "keep-alive"
+http_session.mount(
+    "https://", HTTPAdapter(pool_connections=THREAD_COUNT, pool_maxsize=THREAD_COUNT)
+)
+
+# next() on a cycle is atomic under the GIL, so key rotation needs no lock.
+_domainr_key_cycle = itertools.cycle(DOMAINR_API_KEYS) if DOMAINR_API_KEYS else None
 
 
 def load_domain_list(input_file):
     """Load a list of domains from a file."""
     if not os.path.exists(input_file):
-        logger.error(f"Domain list file {input_file} not found.")
+        logger.error("Domain list file %s not found.", input_file)
         sys.exit(1)
-    with open(input_file, "r", encoding="utf-8") as f:
-        domains = [line.strip() for line in f if line.strip()]
-    return domains
+    # Decode the whole file at once and strip lines with a C-level map instead
+    # of stripping every line twice in a Python loop.
+    with open(input_file, "rb") as f:
+        text = f.read().decode("utf-8")
+    return [line for line in map(str.strip, text.splitlines()) if line]
 
 
 def load_previous_status():
@@ -105,98 +188,525 @@ def load_previous_status():
             with open(STATUS_FILE, "r") as f:
                 return json.load(f)
         except Exception as e:
-            logger.error(f"Error reading status file: {e}")
+            logger.error("Error reading status file: %s", e)
     return {}
 
 
 def save_status(status):
+    """
+    Save domain statuses as compact JSON, written to a temp file and moved
+    into place so a crash never leaves a truncated status file.
+    """
     os.makedirs("output", exist_ok=True)
-    with open(STATUS_FILE, "w") as f:
-        json.dump(status, f, indent=2)
+    atomic_write(STATUS_FILE, json.dumps(status, separators=(",", ":")))
+
+
+def open_cache():
+    """Open the availability cache database, creating the schema if needed."""
+    os.makedirs("output", exist_ok=True)
+    conn = sqlite3.connect(CACHE_FILE)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cache "
+        "(domain TEXT PRIMARY KEY, available INT, expires REAL)"
+    )
+    return conn
+
+
+def load_cache(conn, now):
+    """Return a dict of punycode domain -> available for unexpired cache entries."""
+    try:
+        rows = conn.execute(
+            "SELECT domain, available FROM cache WHERE expires > ?", (now,)
+        )
+        return {domain: bool(available) for domain, available in rows}
+    except sqlite3.Error as e:
+        logger.error("Error reading cache: %s", e)
+        return {}
+
+
+def save_cache(conn, entries, now):
+    """
+    Store (domain_punycode, available, expires) entries and purge expired ones,
+    all in a single transaction.
+    """
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache (domain, available, expires) "
+                "VALUES (?, ?, ?)",
+                entries,
+            )
+            conn.execute("DELETE FROM cache WHERE expires <= ?", (now,))
+    except sqlite3.Error as e:
+        logger.error("Error writing cache: %s", e)
+
+
+def cache_ttl(available):
+    """Return a jittered TTL for a cache entry, shorter for available domains."""
+    ttl = CACHE_TTL_AVAILABLE if available else CACHE_TTL_TAKEN
+    return ttl * random.uniform(1 - CACHE_TTL_JITTER, 1 + CACHE_TTL_JITTER)
+
+
+@functools.lru_cache(maxsize=None)
+def to_punycode(domain):
+    """Convert a domain to its ASCII (punycode) form, falling back to the input."""
+    if domain.isascii():
+        return domain
+    try:
+        return idna.encode(domain, uts46=True).decode("ascii")
+    except idna.IDNAError:
+        # IDNA 2008 rejects symbols such as emoji; retry with the IDNA 2003 codec.
+        pass
+    try:
+        return domain.encode("idna").decode("ascii")
+    except Exception as e:
+        logger.error("Error converting %s to punycode: %s", domain, e)
+        return domain
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_tld(tld):
+    """
+    Return the canonical lower-case form of a TLD label.
+    Cached, so every domain in a TLD shares one string instead of a new copy.
+    """
+    return tld.strip().lower()
 
 
 def rotate_domainr_key():
     """Rotate to the next Domainr API key."""
-    global DOMAINR_API_KEY_INDEX
-    with api_key_lock:
-        if not DOMAINR_API_KEYS:
-            return None
-        key = DOMAINR_API_KEYS[DOMAINR_API_KEY_INDEX]
-        DOMAINR_API_KEY_INDEX = (DOMAINR_API_KEY_INDEX + 1) % len(DOMAINR_API_KEYS)
-        return key
+    return next(_domainr_key_cycle) if _domainr_key_cycle else None
 
 
 def whois_lookup(domain_punycode):
-    """Perform a WHOIS lookup for the domain. Returns True if available."""
+    """
+    Perform a WHOIS lookup for the domain.
+    Returns True if available, False if taken, or None if the lookup failed.
+    """
     try:
         result = whois.whois(domain_punycode)
         if not result or result.get("domain_name") is None:
             return True
         return False
-    except Exception as e:
-        logger.warning(f"WHOIS lookup exception for {domain_punycode}: {e}")
+    except WHOIS_FAILURES as e:
+        logger.warning("WHOIS lookup failed for %s: %s", domain_punycode, e)
+        return None
+    except PywhoisError:
+        # python-whois reports unregistered domains (WhoisDomainNotFoundError)
+        # and unparseable "no match" replies by raising.
         return True
+    except Exception as e:
+        logger.warning("WHOIS lookup exception for %s: %s", domain_punycode, e)
+        return None
 
 
-def domainr_lookup(domain_punycode):
-    """Perform a lookup using the Domainr API. Returns True if available."""
-    api_key = rotate_domainr_key()
-    if not api_key:
-        logger.error("No Domainr API key provided.")
-        return False
-    url = "https://api.domainr.com/v2/status"
-    params = {"domain": domain_punycode}
-    headers = {}
-    if DOMAINR_API_TYPE == "rapidapi":
-        headers["X-RapidAPI-Key"] = api_key
-        headers["X-RapidAPI-Host"] = "domainr.p.rapidapi.com"
-    else:
-        params["client_id"] = api_key
+class PrefetchingResolver(AbstractResolver):
+    """
+    aiohttp resolver that memoizes lookups for the lifetime of a run and can
+    resolve a batch of hosts ahead of time, keeping DNS off the request path.
+    """
+
+    def __init__(self):
+        self._resolver = aiohttp.DefaultResolver()
+        self._cache = {}
+
+    async def resolve(self, host, port=0, family=socket.AF_INET):
+        key = (host, port, family)
+        if key not in self._cache:
+            self._cache[key] = await self._resolver.resolve(host, port, family)
+        return self._cache[key]
+
+    async def close(self):
+        await self._resolver.close()
+
+    async def prefetch(self, hosts, port=443, family=socket.AF_UNSPEC):
+        """
+        Resolve hosts concurrently, capped at half the thread count since the
+        default resolver runs getaddrinfo in the executor.
+        """
+        sem = asyncio.Semaphore(max(THREAD_COUNT // 2, 1))
 
+        async def warm(host):
+            async with sem:
+                try:
+                    await self.resolve(host, port, family)
+                except OSError as e:
+                    logger.warning("DNS prefetch failed for %s: %s", host, e)
+
+        await asyncio.gather(*(warm(h) for h in hosts))
+
+
+async def load_rdap_servers(session):
+    """
+    Fetch the IANA RDAP bootstrap registry.
+    Returns a dict of TLD -> RDAP base URL, or None if the registry is unavailable.
+    """
     try:
-        response = requests.get(
-            url, params=params, headers=headers, timeout=CHECK_TIMEOUT
-        )
-        if response.status_code == 429:
+        async with session.get(RDAP_BOOTSTRAP_URL) as response:
+            response.raise_for_status()
+            data = await response.json(content_type=None)
+    except Exception as e:
+        logger.error("Error fetching RDAP bootstrap registry: %s", e)
+        return None
+    return {
+        normalize_tld(tld): service[1][0]
+        for service in data.get("services", [])
+        if service[1]
+        for tld in service[0]
+    }
+
+
+async def rdap_lookup(session, domain_punycode, base_url=None):
+    """
+    Perform an RDAP lookup for the domain against the registry's RDAP base_url
+    from the bootstrap registry, or via rdap.org when it is not known.
+    Returns True if available, False if taken, or None if RDAP gave no answer.
+    """
+    if base_url:
+        url = f"{base_url.rstrip('/')}/domain/{domain_punycode}"
+    else:
+        url = RDAP_URL.format(domain_punycode)
+    try:
+        async with session.get(url) as response:
+            if response.status == 404:
+                return True
+            if response.status == 200:
+                return False
             logger.warning(
-                f"Rate limit hit for {domain_punycode}. Retrying after delay..."
+                "RDAP returned status %s for %s.", response.status, domain_punycode
             )
-            time.sleep(5)
-            return domainr_lookup(domain_punycode)
-        data = response.json()
-        for status in data.get("status", []):
-            if status.get("status") in ("undelegated", "inactive"):
-                return True
-        return False
     except Exception as e:
-        logger.error(f"Domainr lookup error for {domain_punycode}: {e}")
+        logger.warning("RDAP lookup exception for %s: %s", domain_punycode, e)
+    return None
+
+
+class TokenBucket:
+    """
+    Asynchronous token bucket allowing `rate` acquisitions per second,
+    with bursts of up to `capacity`. Usable as an async context manager.
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("TokenBucket rate must be greater than 0")
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info):
         return False
 
 
-def check_domain(domain):
+def backoff_delay(attempt, retry_after=None):
     """
-    Check a domain's availability.
-    Returns tuple (domain, available:bool).
+    Return the delay before retry number `attempt`: the server's Retry-After
+    (in seconds) if given, else full-jitter exponential backoff. Either way the
+    delay is capped at BACKOFF_CAP.
     """
-    logger.info(f"Checking {domain}...")
-    try:
-        domain_punycode = domain.encode("idna").decode("ascii")
-    except Exception as e:
-        logger.error(f"Error converting {domain} to punycode: {e}")
-        domain_punycode = domain
+    if retry_after and retry_after.isdigit():
+        return min(BACKOFF_CAP, float(retry_after))
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
 
-    available = whois_lookup(domain_punycode)
-    if available:
-        logger.info(f"WHOIS indicates {domain} is available.")
-    else:
-        logger.info(f"WHOIS indicates {domain} is taken.")
 
-    # Fallback to Domainr API if needed
+async def domainr_lookup(session, domains_punycode, limiter=None):
+    """
+    Look up one or more domains in a single Domainr API request.
+    Returns a dict of domain -> True if available, False if taken, or None if
+    Domainr gave no answer for it (request errors, exhausted retries).
+    Requests pass through the optional limiter; 429/5xx responses are retried
+    with jittered exponential backoff, rotating the API key on each attempt.
+    """
+    url = "https://api.domainr.com/v2/status"
+    result = dict.fromkeys(domains_punycode)
+    label = ",".join(domains_punycode)
+    for attempt in range(DOMAINR_MAX_RETRIES + 1):
+        api_key = rotate_domainr_key()
+        if not api_key:
+            logger.error("No Domainr API key provided.")
+            return result
+        params = {"domain": label}
+        headers = {}
+        if DOMAINR_API_TYPE == "rapidapi":
+            headers["X-RapidAPI-Key"] = api_key
+            headers["X-RapidAPI-Host"] = "domainr.p.rapidapi.com"
+        else:
+            params["client_id"] = api_key
+
+        try:
+            async with limiter or contextlib.nullcontext():
+                async with session.get(url, params=params, headers=headers) as response:
+                    if response.status == 429 or response.status >= 500:
+                        delay = backoff_delay(
+                            attempt, response.headers.get("Retry-After")
+                        )
+                        retry_status = response.status
+                        data = None
+                    else:
+                        data = await response.json(content_type=None)
+        except Exception as e:
+            logger.error("Domainr lookup error for %s: %s", label, e)
+            return result
+
+        if data is not None:
+            for status in data.get("status", []):
+                domain = status.get("domain", "").lower()
+                if domain in result:
+                    result[domain] = status.get("status") in (
+                        "undelegated",
+                        "inactive",
+                    )
+            return result
+        if attempt == DOMAINR_MAX_RETRIES:
+            break
+        logger.warning(
+            "Domainr returned status %s for %s. Retrying in %.1f seconds...",
+            retry_status,
+            label,
+            delay,
+        )
+        await asyncio.sleep(delay)
+
+    logger.error("Domainr lookup for %s failed after retries.", label)
+    return result
+
+
+class DomainrBatcher:
+    """
+    Coalesce single-domain Domainr lookups into multi-domain requests.
+    Submitted domains are collected until batch_size are queued or max_delay
+    seconds have passed since the first one, then sent as one request.
+    """
+
+    def __init__(self, session, limiter=None, batch_size=10, max_delay=0.05):
+        self.session = session
+        self.limiter = limiter
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self._queue = asyncio.Queue()
+        self._collector = None
+        self._flushes = set()
+
+    async def submit(self, domain_punycode):
+        """Queue a domain for lookup and wait for its availability."""
+        if self._collector is None:
+            self._collector = asyncio.create_task(self._collect())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((domain_punycode, future))
+        return await future
+
+    async def close(self):
+        """Stop collecting; call once no lookups are outstanding."""
+        if self._collector is not None:
+            self._collector.cancel()
+            await asyncio.gather(self._collector, return_exceptions=True)
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            task = asyncio.create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch):
+        domains = list(dict.fromkeys(domain for domain, _ in batch))
+        try:
+            result = await domainr_lookup(self.session, domains, self.limiter)
+        except Exception as e:
+            logger.error("Domainr batch lookup error: %s", e)
+            result = {}
+        for domain, future in batch:
+            if not future.done():
+                future.set_result(result.get(domain))
+
+
+class CheckContext:
+    """
+    Per-run state shared by check_domain_async: the pooled HTTP session, the
+    RDAP server map and the concurrency limits. RDAP lookups are capped
+    globally by rdap_sem; each domain's lookups are also capped per TLD, since
+    every TLD is served by a single registry.
+    """
+
+    def __init__(
+        self, session, rdap_servers=None, whois_pool=None, domainr_batcher=None
+    ):
+        self.session = session
+        self.rdap_servers = rdap_servers
+        self.whois_pool = whois_pool
+        self.domainr_batcher = domainr_batcher
+        self.rdap_sem = asyncio.Semaphore(RDAP_CONCURRENCY)
+        self.tld_sems = collections.defaultdict(
+            lambda: asyncio.Semaphore(TLD_CONCURRENCY)
+        )
+
+
+async def check_domain_async(ctx, domain):
+    """
+    Check a domain's availability using the session and limits in ctx.
+    RDAP is tried first; WHOIS is only used for TLDs without an RDAP service
+    or when RDAP gives no definite answer.
+    Returns tuple (domain, available), where available is None if no lookup
+    gave an answer.
+    """
+    logger.info("Checking %s...", domain)
+    domain_punycode = to_punycode(domain)
+
+    available = None
+    tld = normalize_tld(domain_punycode.rpartition(".")[2])
+    async with ctx.tld_sems[tld]:
+        if ctx.rdap_servers is None or tld in ctx.rdap_servers:
+            base_url = ctx.rdap_servers[tld] if ctx.rdap_servers else None
+            async with ctx.rdap_sem:
+                available = await rdap_lookup(ctx.session, domain_punycode, base_url)
+            if available is not None:
+                state = "available" if available else "taken"
+                logger.info("RDAP indicates %s is %s.", domain, state)
+
+        if available is None:
+            loop = asyncio.get_running_loop()
+            available = await loop.run_in_executor(
+                ctx.whois_pool, whois_lookup, domain_punycode
+            )
+            if available:
+                logger.info("WHOIS indicates %s is available.", domain)
+            elif available is not None:
+                logger.info("WHOIS indicates %s is taken.", domain)
+
+    # Fallback to Domainr API if needed; only a definite answer replaces the
+    # earlier result.
     if not available and DOMAINR_API_KEYS:
-        available = domainr_lookup(domain_punycode)
+        if ctx.domainr_batcher is not None:
+            domainr_available = await ctx.domainr_batcher.submit(domain_punycode)
+        else:
+            result = await domainr_lookup(ctx.session, [domain_punycode])
+            domainr_available = result[domain_punycode]
+        if domainr_available is not None:
+            available = domainr_available
     return domain, available
 
 
+async def check_all_domains(domains, known=None):
+    """
+    Check availability for a list of domains on a single event loop.
+    known optionally maps domains to availability already answered elsewhere
+    (e.g. a bulk API); those and unexpired entries in the availability cache
+    skip the network entirely. The rest are scheduled in chunks of
+    CHECK_BATCH_SIZE over one pooled, keep-alive HTTP session, and all fresh
+    answers are written back to the cache at the end.
+    Returns a list with a (domain, available) tuple or an exception per domain.
+    """
+    known = known or {}
+    conn = open_cache()
+    now = time.time()
+    cached = load_cache(conn, now)
+    punycodes = [to_punycode(d) for d in domains]
+    results = []
+    misses = []
+    entries = []
+    for i, (domain, punycode) in enumerate(zip(domains, punycodes)):
+        if domain in known:
+            available = known[domain]
+            results.append((domain, available))
+            entries.append((punycode, int(available), now + cache_ttl(available)))
+        elif punycode in cached:
+            results.append((domain, cached[punycode]))
+        else:
+            results.append(None)
+            misses.append(i)
+    logger.info(
+        "%s of %s domains served from cache or pre-resolved.",
+        len(domains) - len(misses),
+        len(domains),
+    )
+
+    if misses:
+        resolver = PrefetchingResolver()
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONNECTIONS,
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            keepalive_timeout=75,
+            resolver=resolver,
+        )
+        # Per-socket timeouts only: time spent waiting for a pooled connection
+        # must not count against a lookup.
+        timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=CHECK_TIMEOUT, sock_read=CHECK_TIMEOUT
+        )
+        whois_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=WHOIS_WORKERS, thread_name_prefix="whois"
+        )
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout
+        ) as session:
+            domainr_batcher = DomainrBatcher(
+                session, TokenBucket(DOMAINR_RATE_LIMIT), DOMAINR_BATCH_SIZE
+            )
+            rdap_servers = await load_rdap_servers(session)
+            # Lookups go straight to each registry's RDAP server (rdap.org only
+            # without a bootstrap registry), so resolve those hosts up front.
+            hosts = set()
+            if rdap_servers:
+                for i in misses:
+                    tld = normalize_tld(punycodes[i].rpartition(".")[2])
+                    base_url = rdap_servers.get(tld)
+                    if base_url:
+                        hosts.add(urlsplit(base_url).hostname)
+            else:
+                hosts.add(urlsplit(RDAP_URL).hostname)
+            await resolver.prefetch(hosts)
+            ctx = CheckContext(session, rdap_servers, whois_pool, domainr_batcher)
+            for start in range(0, len(misses), CHECK_BATCH_SIZE):
+                batch = misses[start : start + CHECK_BATCH_SIZE]
+                fetched = await asyncio.gather(
+                    *(check_domain_async(ctx, domains[i]) for i in batch),
+                    return_exceptions=True,
+                )
+                for i, result in zip(batch, fetched):
+                    results[i] = result
+                    # Failed lookups are retried next run rather than cached.
+                    if not isinstance(result, Exception) and result[1] is not None:
+                        available = result[1]
+                        entries.append(
+                            (punycodes[i], int(available), now + cache_ttl(available))
+                        )
+            await domainr_batcher.close()
+        await resolver.close()
+        whois_pool.shutdown()
+
+    save_cache(conn, entries, now)
+    conn.close()
+    return results
+
+
 def send_email_notification(new_domains, summary):
     """Send an email notification with available domains."""
     try:
@@ -211,7 +721,7 @@ def send_email_notification(new_domains, summary):
             server.sendmail(SMTP_USER, [EMAIL_TO], msg.as_string())
         logger.info("Email notification sent.")
     except Exception as e:
-        logger.error(f"Error sending email: {e}")
+        logger.error("Error sending email: %s", e)
 
 
 def send_webhook_notification(new_domains, summary):
@@ -222,45 +732,53 @@ def send_webhook_notification(new_domains, summary):
             "domains": new_domains,
             "summary": summary,
         }
-        response = requests.post(WEBHOOK_URL, json=payload, timeout=CHECK_TIMEOUT)
+        response = http_session.post(WEBHOOK_URL, json=payload, timeout=CHECK_TIMEOUT)
         if response.status_code == 200:
             logger.info("Webhook notification sent.")
         else:
-            logger.warning(f"Webhook responded with status {response.status_code}.")
+            logger.warning("Webhook responded with status %s.", response.status_code)
     except Exception as e:
-        logger.error(f"Error sending webhook: {e}")
+        logger.error("Error sending webhook: %s", e)
 
 
-def score_domain(domain):
+# Score contribution per TLD; any other TLD scores 10.
+TLD_SCORES = {"com": 30, "net": 20, "org": 20}
+
+
+@functools.lru_cache(maxsize=4096)
+def score_name(name):
     """
-    Compute a heuristic score for the domain.
-    Returns an integer score (0-100).
+    Compute the SLD part of a domain's score (length bonus, hyphen/digit penalty).
+    Cached, since available domains share a small set of SLDs across many TLDs.
     """
-    score = 0
-    try:
-        name, tld = domain.split(".")
-    except Exception:
-        return 0
     if len(name) <= 3:
-        score += 40
+        score = 40
     elif len(name) <= 5:
-        score += 30
+        score = 30
     else:
-        score += 10
-    if tld == "com":
-        score += 30
-    elif tld in {"net", "org"}:
-        score += 20
-    else:
-        score += 10
+        score = 10
     if "-" in name or any(char.isdigit() for char in name):
         score -= 20
+    return score
+
+
+def score_domain(domain):
+    """
+    Compute a heuristic score for the domain.
+    Returns an integer score (0-100).
+    """
+    name, dot, tld = domain.partition(".")
+    if not dot or "." in tld:
+        return 0
+    score = score_name(name) + TLD_SCORES.get(tld, 10)
     return max(0, min(score, 100))
 
 
-def check_domains(domains):
+async def check_domains_async(domains, known=None):
     """
-    Check availability for a list of domains.
+    Check availability for a list of domains from a running event loop.
+    known optionally maps domains to availability answered elsewhere; they are
+    reported, diffed against the previous run and cached like checked domains.
     Returns a dict with keys 'available', 'unavailable', 'errors', and 'summary'.
     """
     previous_status = load_previous_status()
@@ -271,22 +789,28 @@ def check_domains(domains):
     errors = []
 
     start_time = time.time()
-    with concurrent.futures.ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
-        future_to_domain = {executor.submit(check_domain, d): d for d in domains}
-        for future in concurrent.futures.as_completed(future_to_domain):
-            try:
-                domain, available = future.result()
-            except Exception as e:
-                logger.error(f"Error checking domain: {e}")
-                errors.append(future_to_domain[future])
-                continue
-            current_status[domain] = available
-            if available:
-                available_domains.append(domain)
-                if not previous_status.get(domain, False):
-                    new_available.append(domain)
-            else:
-                unavailable_domains.append(domain)
+    results = await check_all_domains(domains, known)
+    for domain, result in zip(domains, results):
+        if isinstance(result, Exception):
+            logger.error("Error checking domain %s: %s", domain, result)
+            available = None
+        else:
+            _, available = result
+            if available is None:
+                logger.error("No lookup could determine the status of %s.", domain)
+        if available is None:
+            errors.append(domain)
+            # Keep the last known status so a later success is not re-alerted.
+            if domain in previous_status:
+                current_status[domain] = previous_status[domain]
+            continue
+        current_status[domain] = available
+        if available:
+            available_domains.append(domain)
+            if not previous_status.get(domain, False):
+                new_available.append(domain)
+        else:
+            unavailable_domains.append(domain)
     duration = time.time() - start_time
     summary = (
         f"Checked {len(domains)} domains in {duration:.1f} seconds. "
@@ -295,17 +819,18 @@ def check_domains(domains):
     logger.info(summary)
 
     os.makedirs("output", exist_ok=True)
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        for d in available_domains:
-            f.write(f"{d} (Score: {score_domain(d)})\n")
+    with open(OUTPUT_FILE, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.writelines(f"{d} (Score: {score_domain(d)})\n" for d in available_domains)
+        f.flush()
+        os.fsync(f.fileno())
 
     save_status(current_status)
 
     if new_available:
         if ENABLE_EMAIL:
-            send_email_notification(new_available, summary)
+            await asyncio.to_thread(send_email_notification, new_available, summary)
         if ENABLE_WEBHOOK and WEBHOOK_URL:
-            send_webhook_notification(new_available, summary)
+            await asyncio.to_thread(send_webhook_notification, new_available, summary)
 
     return {
         "available": available_domains,
@@ -315,9 +840,17 @@ def check_domains(domains):
     }
 
 
+def check_domains(domains):
+    """
+    Check availability for a list of domains.
+    Returns a dict with keys 'available', 'unavailable', 'errors', and 'summary'.
+    """
+    return asyncio.run(check_domains_async(domains))
+
+
 def main():
     parser = argparse.ArgumentParser(
-        description="Check domain availability using WHOIS and Domainr API with multi-threading."
+        description="Check domain availability using RDAP, WHOIS and Domainr API with asyncio."
     )
     parser.add_argument(
         "--domains-file",
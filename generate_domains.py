@@ -1,18 +1,35 @@
 #!/usr/bin/env python3
 import itertools
+import operator
 import string
 import argparse
 import sys
 import logging
 import json
 import os
+import pickle
+import re
+import time
 import requests
 
+from atomic_write import atomic_write
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is used instead
+    orjson = None
+
+# Matches "${VAR}" or "${VAR:-default}" config values.
+ENV_VAR_PATTERN = re.compile(
+    r"\A\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-(.*))?\}\Z", re.DOTALL
+)
+
 
 def load_config():
     """
     Load configuration from config.json and resolve any environment variable placeholders.
-    For any string value of the form "${VAR}", substitute it with the value of the environment variable VAR.
+    For any string value of the form "${VAR}", substitute it with the value of the environment variable VAR;
+    "${VAR:-default}" falls back to default when VAR is unset or empty.
     """
     try:
         with open("config.json") as f:
@@ -20,20 +37,26 @@ def load_config():
     except Exception as e:
         sys.exit(f"Error loading config.json: {e}")
 
-    def resolve(item):
-        if isinstance(item, dict):
-            return {k: resolve(v) for k, v in item.items()}
-        elif isinstance(item, list):
-            return [resolve(x) for x in item]
-        elif isinstance(item, str):
-            if item.startswith("${") and item.endswith("}"):
-                env_var = item[2:-1]
-                return os.environ.get(env_var, item)
-            return item
-        else:
-            return item
-
-    return resolve(config)
+    # Walk the tree with an explicit stack, substituting string leaves in place.
+    # JSON only yields exact built-in types, so nodes dispatch on type() with a
+    # dict probe rather than isinstance() checks.
+    children = {dict: dict.items, list: enumerate}
+    stack = [config] if type(config) in children else []
+    while stack:
+        node = stack.pop()
+        for key, value in children[type(node)](node):
+            kind = type(value)
+            if kind is str:
+                match = ENV_VAR_PATTERN.match(value)
+                if match:
+                    name, default = match.groups()
+                    if default is None:
+                        node[key] = os.environ.get(name, value)
+                    else:
+                        node[key] = os.environ.get(name) or default
+            elif kind in children:
+                stack.append(value)
+    return config
 
 
 # Load configuration (with env var resolution)
@@ -47,6 +70,10 @@ try:
     handlers.append(logging.FileHandler(LOG_FILE))
 except PermissionError as e:
     print(f"Warning: Unable to open log file {LOG_FILE}: {e}")
+# The log format uses no thread or process fields, so skip collecting them.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
@@ -55,26 +82,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 RESERVED_FILE = "reserved_domains.json"
+TLD_CACHE_FILE = "output/tlds.pkl"
+# JSON cache written by earlier versions; read once so an upgrade keeps its validators.
+LEGACY_TLD_CACHE_FILE = "output/tlds.json"
+TLD_CACHE_TTL = 86400  # seconds before the cached TLD list is revalidated
+# Cache file mtimes seen or set by this process. Only this module writes the TLD
+# cache, so repeated get_valid_tlds() calls can skip the stat after the first.
+_cache_mtimes = {}
+# A whole line holding exactly two non-space characters, the first not "#".
+TWO_LETTER_LINE = re.compile(rb"^[ \t\r\f\v]*([^#\s]\S)[ \t\r\f\v]*$", re.MULTILINE)
+TLD_CHUNK_SIZE = 16384  # bytes of the streamed IANA list parsed at a time
+WRITE_CHUNK = 8192  # lines encoded and written per write() call (~64 KiB)
 
 
 def load_reserved_list():
     """
-    Load the set of reserved domain strings from RESERVED_FILE.
-    Returns an empty set if the file does not exist or cannot be read.
+    Load the frozenset of reserved domain strings from RESERVED_FILE.
+    Returns an empty frozenset if the file does not exist or cannot be read.
     """
     if os.path.exists(RESERVED_FILE):
         try:
-            with open(RESERVED_FILE, "r") as f:
+            with open(RESERVED_FILE, "r", encoding="utf-8") as f:
                 data = json.load(f)
-                return set(data.get("reserved", []))
+                return frozenset(data.get("reserved", []))
         except Exception as e:
-            logger.error(f"Error reading reserved file: {e}")
-            return set()
+            logger.error("Error reading reserved file: %s", e)
+            return frozenset()
     else:
         logger.warning(
-            f"Reserved file {RESERVED_FILE} not found. Using empty reserved list."
+            "Reserved file %s not found. Using empty reserved list.", RESERVED_FILE
         )
-        return set()
+        return frozenset()
 
 
 def load_valid_words():
@@ -93,44 +131,121 @@ def load_valid_words():
     except LookupError:
         logger.info("Downloading NLTK words corpus...")
         nltk.download("words")
-    valid = set(word.lower() for word in nltk_words.words() if len(word) == 4)
+    # Stream the corpus files line by line rather than materializing the full
+    # ~236k-word list; only ASCII letters can form a candidate domain.
+    valid = set()
+    for fileid in nltk_words.fileids():
+        with nltk_words.open(fileid) as f:
+            for line in f:
+                word = line.strip()
+                if len(word) == 4 and word.isascii() and word.isalpha():
+                    valid.add(word.lower())
     return valid
 
 
-def get_valid_tlds():
+def load_tld_cache(max_age=TLD_CACHE_TTL):
+    """
+    Load the cached TLD list and its validators from TLD_CACHE_FILE, falling back
+    to the legacy JSON cache. The format is picked by file extension.
+    Returns a tuple (data, fresh), where data is None if there is no usable cache
+    and fresh is True if it was written less than max_age seconds ago.
+    """
+    for path in (TLD_CACHE_FILE, LEGACY_TLD_CACHE_FILE):
+        try:
+            mtime = _cache_mtimes.get(path)
+            if mtime is None:
+                mtime = _cache_mtimes[path] = os.stat(path).st_mtime
+            age = time.time() - mtime
+            if path.endswith(".pkl"):
+                with open(path, "rb") as f:
+                    return pickle.load(f), age < max_age
+            if orjson:
+                with open(path, "rb") as f:
+                    return orjson.loads(f.read()), age < max_age
+            with open(path, "r") as f:
+                return json.load(f), age < max_age
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            logger.error("Error reading TLD cache %s: %s", path, e)
+            return None, False
+    return None, False
+
+
+def save_tld_cache(tlds, etag, last_modified=None):
+    """
+    Atomically write the TLD list and its validators to TLD_CACHE_FILE as a
+    pickle, which loads without tokenizing every character like JSON does.
+    """
+    data = {"etag": etag, "last_modified": last_modified, "tlds": tlds}
+    try:
+        os.makedirs(os.path.dirname(TLD_CACHE_FILE), exist_ok=True)
+        atomic_write(TLD_CACHE_FILE, pickle.dumps(data, protocol=5))
+        _cache_mtimes[TLD_CACHE_FILE] = time.time()
+    except OSError as e:
+        logger.error("Error writing TLD cache: %s", e)
+
+
+def parse_tld_list(chunks):
+    """
+    Return the lower-cased two-letter TLDs listed one per line in chunks, an
+    iterable of bytes such as a streamed response's iter_content(). Complete
+    lines are parsed as each chunk arrives, with one regex scan per chunk, so
+    only the matching labels are ever decoded.
+    """
+    tlds = []
+    tail = b""
+    for chunk in chunks:
+        data = tail + chunk
+        cut = data.rfind(b"\n") + 1
+        tlds += TWO_LETTER_LINE.findall(data, 0, cut)
+        tail = data[cut:]
+    tlds += TWO_LETTER_LINE.findall(tail)
+    return b"\n".join(tlds).decode("utf-8").lower().split("\n") if tlds else []
+
+
+def get_valid_tlds(max_age=TLD_CACHE_TTL):
     """
     Fetch the current TLD list from IANA and return only two-letter TLDs.
+    The list is cached on disk for max_age seconds; once stale it is
+    revalidated with the stored ETag / Last-Modified so an unchanged list is
+    not re-downloaded.
     """
+    cached, fresh = load_tld_cache(max_age)
+    if fresh:
+        logger.info("Using %s cached two-letter TLDs.", len(cached["tlds"]))
+        return cached["tlds"]
     url = "https://data.iana.org/TLD/tlds-alpha-by-domain.txt"
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
     try:
-        r = requests.get(url, timeout=10)
-        r.raise_for_status()
-        lines = r.text.splitlines()
-        tlds = [
-            line.strip().lower()
-            for line in lines
-            if line and not line.startswith("#") and len(line.strip()) == 2
-        ]
-        logger.info(f"Fetched {len(tlds)} two-letter TLDs from IANA.")
+        with requests.get(url, headers=headers, timeout=10, stream=True) as r:
+            if r.status_code == 304 and cached:
+                try:
+                    os.utime(TLD_CACHE_FILE)
+                    _cache_mtimes[TLD_CACHE_FILE] = time.time()
+                except FileNotFoundError:  # validators came from the legacy cache
+                    save_tld_cache(
+                        cached["tlds"], cached.get("etag"), cached.get("last_modified")
+                    )
+                logger.info("IANA TLD list unchanged; using cached copy.")
+                return cached["tlds"]
+            r.raise_for_status()
+            tlds = parse_tld_list(r.iter_content(TLD_CHUNK_SIZE))
+        logger.info("Fetched %s two-letter TLDs from IANA.", len(tlds))
+        save_tld_cache(tlds, r.headers.get("ETag"), r.headers.get("Last-Modified"))
         return tlds
     except Exception as e:
-        logger.error(f"Error fetching TLD list: {e}")
+        logger.error("Error fetching TLD list: %s", e)
+        if cached:
+            logger.info("Using stale cached TLD list.")
+            return cached["tlds"]
         return ["us", "uk", "ca", "de", "fr"]
 
 
-def is_reserved(domain_str, tld_str, reserved_set):
-    """
-    Check if the candidate combination should be excluded.
-    Returns True if either the SLD or TLD is reserved or the full combination is reserved.
-    """
-    if domain_str == tld_str:
-        return True
-    if domain_str in reserved_set or tld_str in reserved_set:
-        return True
-    candidate_word = domain_str + tld_str
-    return candidate_word in reserved_set
-
-
 def generate_domains(
     prefix_domain="",
     prefix_tld="",
@@ -138,6 +253,7 @@ def generate_domains(
     valid_words_set=None,
     reserved_set=None,
     emoji_mode=False,
+    tlds=None,
 ):
     """
     Generate candidate domains.
@@ -150,48 +266,112 @@ def generate_domains(
       - prefix_tld: TLD must start with these characters.
       - only_words: Only yield domains where the concatenation of SLD and TLD is a valid 4-letter word.
       - reserved_set: A set of reserved strings to exclude.
+
+    tlds: TLD list to use instead of fetching it from IANA (e.g. a cached copy).
     """
     count = 0
     if emoji_mode:
         emoji_list = ["😀", "😃", "😄", "😁", "😆", "😂", "🤣", "😊", "😍", "😉"]
-        for domain_tuple in itertools.product(emoji_list, repeat=2):
-            domain_str = "".join(domain_tuple)
-            if prefix_domain and not domain_str.startswith(prefix_domain):
-                continue
-            for tld_tuple in itertools.product(emoji_list, repeat=2):
-                tld_str = "".join(tld_tuple)
-                if prefix_tld and not tld_str.startswith(prefix_tld):
-                    continue
+        # Build every 2-emoji label once instead of re-joining the TLD
+        # product for each SLD; prefixes are applied to the label lists.
+        emoji_labels = ["".join(t) for t in itertools.product(emoji_list, repeat=2)]
+        emoji_slds = [s for s in emoji_labels if s.startswith(prefix_domain)]
+        emoji_tlds = [t for t in emoji_labels if t.startswith(prefix_tld)]
+        for domain_str in emoji_slds:
+            for tld_str in emoji_tlds:
                 yield f"{domain_str}.{tld_str}"
                 count += 1
                 if count % 1000 == 0:
-                    logger.info(f"Generated {count} emoji candidate domains so far...")
+                    logger.info("Generated %s emoji candidate domains so far...", count)
     else:
         letters = string.ascii_lowercase
-        valid_tlds = get_valid_tlds()
+        valid_tlds = get_valid_tlds() if tlds is None else tlds
         # Apply minimum TLD length from config
         min_tld = config.get("min_tld_length", 2)
-        valid_tlds = [t for t in valid_tlds if len(t) >= min_tld]
-        for domain_tuple in itertools.product(letters, repeat=2):
+        # Filter the TLD axis of the SLD x TLD grid once; each SLD row is then
+        # masked in a single C-level pass over its concatenated candidate words.
+        # In word mode the rows come from the word list itself instead.
+        tld_axis = [
+            t
+            for t in valid_tlds
+            if len(t) >= min_tld
+            and (not prefix_tld or t.startswith(prefix_tld))
+            and not (reserved_set and t in reserved_set)
+        ]
+        words_by_sld = None
+        if only_words and valid_words_set:
+            # Index allowed words by their 2-letter SLD (TLDs kept in list order)
+            # so only actual words are visited rather than every SLD x TLD pair.
+            tld_rank = {t: i for i, t in enumerate(tld_axis)}
+            words_by_sld = {}
+            for word in valid_words_set.difference(reserved_set or ()):
+                sld, tld = word[:2], word[2:]
+                if tld in tld_rank and not (reserved_set and sld == tld):
+                    words_by_sld.setdefault(sld, []).append(tld)
+            for row in words_by_sld.values():
+                row.sort(key=tld_rank.__getitem__)
+        # Only enumerate the SLD bucket matching the first prefix character.
+        first_letters = letters
+        if prefix_domain:
+            first_letters = prefix_domain[0] if prefix_domain[0] in letters else ""
+        for domain_tuple in itertools.product(first_letters, letters):
             domain_str = "".join(domain_tuple)
             if prefix_domain and not domain_str.startswith(prefix_domain):
                 continue
-            for tld in valid_tlds:
-                if prefix_tld and not tld.startswith(prefix_tld):
-                    continue
-                if reserved_set and is_reserved(domain_str, tld, reserved_set):
-                    continue
-                candidate_word = domain_str + tld
-                if (
-                    only_words
-                    and valid_words_set
-                    and candidate_word not in valid_words_set
-                ):
-                    continue
-                yield f"{domain_str}.{tld}"
-                count += 1
-                if count % 1000 == 0:
-                    logger.info(f"Generated {count} candidate domains so far...")
+            if reserved_set and domain_str in reserved_set:
+                continue
+            # Each row is fully filtered here, so emitting it is a single
+            # C-level map with no per-candidate checks.
+            if words_by_sld is not None:
+                row = words_by_sld.get(domain_str, ())
+            elif reserved_set:
+                candidate_words = map(domain_str.__add__, tld_axis)
+                row = list(
+                    itertools.compress(
+                        tld_axis,
+                        map(
+                            operator.not_,
+                            map(reserved_set.__contains__, candidate_words),
+                        ),
+                    )
+                )
+                if domain_str in row:
+                    row = [t for t in row if t != domain_str]
+            else:
+                row = tld_axis
+            yield from map(f"{domain_str}.".__add__, row)
+            if (count + len(row)) // 1000 > count // 1000:
+                logger.info(
+                    "Generated %s candidate domains so far...", count + len(row)
+                )
+            count += len(row)
+
+
+def _write_all(fd, data):
+    """Write all of data to fd, resuming after short writes."""
+    remaining = memoryview(data)
+    while remaining:
+        remaining = remaining[os.write(fd, remaining) :]
+
+
+def write_domains(path, domains):
+    """
+    Write one domain per line to path and return the number of domains written.
+    Lines are joined and encoded WRITE_CHUNK at a time, so each chunk costs one
+    encode and one write() rather than one per line, followed by one fsync.
+    """
+    count = 0
+    domains = iter(domains)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while chunk := list(itertools.islice(domains, WRITE_CHUNK)):
+            count += len(chunk)
+            chunk.append("")
+            _write_all(fd, "\n".join(chunk).encode("utf-8"))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return count
 
 
 def main():
@@ -232,19 +412,18 @@ def main():
     reserved_set = load_reserved_list() if not args.emoji else None
     valid_words_set = load_valid_words() if args.only_words and not args.emoji else None
 
-    count = 0
-    with open(args.outfile, "w", encoding="utf-8") as f:
-        for domain in generate_domains(
+    count = write_domains(
+        args.outfile,
+        generate_domains(
             args.prefix_domain,
             args.prefix_tld,
             args.only_words,
             valid_words_set,
             reserved_set,
             emoji_mode=args.emoji,
-        ):
-            f.write(domain + "\n")
-            count += 1
-    logger.info(f"Generated {count} candidate domains and saved to {args.outfile}")
+        ),
+    )
+    logger.info("Generated %s candidate domains and saved to %s", count, args.outfile)
 
 
 if __name__ == "__main__":
@@ -3,12 +3,19 @@ import json
 import logging
 import sys
 import os
+import re
+
+# Matches "${VAR}" or "${VAR:-default}" config values.
+ENV_VAR_PATTERN = re.compile(
+    r"\A\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-(.*))?\}\Z", re.DOTALL
+)
 
 
 def load_config():
     """
     Load configuration from config.json and resolve any environment variable placeholders.
-    Any string in the form "${VAR}" will be replaced with the value of the environment variable VAR.
+    Any string in the form "${VAR}" will be replaced with the value of the environment variable VAR;
+    "${VAR:-default}" falls back to default when VAR is unset or empty.
     """
     try:
         with open("config.json") as f:
@@ -16,26 +23,36 @@ def load_config():
     except Exception as e:
         sys.exit(f"Error loading config.json: {e}")
 
-    def resolve(item):
-        if isinstance(item, dict):
-            return {k: resolve(v) for k, v in item.items()}
-        elif isinstance(item, list):
-            return [resolve(x) for x in item]
-        elif isinstance(item, str):
-            if item.startswith("${") and item.endswith("}"):
-                env_var = item[2:-1]
-                return os.environ.get(env_var, item)
-            return item
-        else:
-            return item
-
-    return resolve(config)
+    # Walk the tree with an explicit stack, substituting string leaves in place.
+    # JSON only yields exact built-in types, so nodes dispatch on type() with a
+    # dict probe rather than isinstance() checks.
+    children = {dict: dict.items, list: enumerate}
+    stack = [config] if type(config) in children else []
+    while stack:
+        node = stack.pop()
+        for key, value in children[type(node)](node):
+            kind = type(value)
+            if kind is str:
+                match = ENV_VAR_PATTERN.match(value)
+                if match:
+                    name, default = match.groups()
+                    if default is None:
+                        node[key] = os.environ.get(name, value)
+                    else:
+                        node[key] = os.environ.get(name) or default
+            elif kind in children:
+                stack.append(value)
+    return config
 
 
 # Load configuration using the new loader
 config = load_config()
 
 # Set up logging
+# The log format uses no thread or process fields, so skip collecting them.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
 )
@@ -65,20 +82,20 @@ def filter_domains(domains, config_min_length, tld_minimums, default_min=3):
     """
     Filter domains based on the configured minimum SLD length and each TLD's allowed minimum.
     """
+    # The TLD check only depends on the TLD, so evaluate it once per TLD
+    # up front; each domain then costs one dict lookup and one comparison.
+    default_ok = config_min_length >= default_min
+    tld_ok = {tld: config_min_length >= m for tld, m in tld_minimums.items()}
     filtered = []
     for domain in domains:
-        parts = domain.split(".")
-        if len(parts) != 2:
-            continue
-        sld, tld = parts
-        allowed_min = tld_minimums.get(tld, default_min)
-        if config_min_length < allowed_min:
+        sld, dot, tld = domain.partition(".")
+        if not dot or "." in tld:
             continue
-        if len(sld) >= config_min_length:
+        if tld_ok.get(tld, default_ok) and len(sld) >= config_min_length:
             filtered.append(domain)
     return filtered
 
 
 filtered_domains = filter_domains(domains, config_min_length, tld_minimums, default_min)
-logger.info(f"Filtered domains: {filtered_domains}")
+logger.info("Filtered domains: %s", filtered_domains)
 print("Filtered domains:", filtered_domains)
@@ -3,39 +3,97 @@ import json
 import logging
 from datetime import datetime, timezone
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is used instead
+    orjson = None
+
 # Set up logging
+# The log format uses no thread or process fields, so skip collecting them.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
 )
 logger = logging.getLogger(__name__)
 
 RESERVED_FILE = "reserved_domains.json"
+# Plain-text sources with one reserved name per line; None keeps the built-in list.
+IANA_RESERVED_URL = None
+ICANN_RESERVED_URL = None
+
+# One pooled keep-alive session, so both fetches share a TLS connection.
+http_session = requests.Session()
+http_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
+
+
+def fetch_reserved_names(url, fallback):
+    """
+    Stream a reserved-name list from url, skipping blank lines and # comments.
+    Returns fallback if url is None or the download fails.
+    """
+    if url is None:
+        return fallback
+    try:
+        with http_session.get(url, timeout=10, stream=True) as r:
+            r.raise_for_status()
+            r.encoding = r.encoding or "utf-8"
+            return [
+                name
+                for name in map(str.strip, r.iter_lines(decode_unicode=True))
+                if name and name[0] != "#"
+            ]
+    except Exception as e:
+        logger.error("Error fetching reserved names from %s: %s", url, e)
+        return fallback
 
 
 def update_iana_reserved():
     """
     Fetch reserved TLDs/domains from IANA.
-    For demo purposes, returns a fixed list.
+    For demo purposes, returns a fixed list unless IANA_RESERVED_URL is set.
     """
-    return ["example", "invalid", "localhost", "test"]
+    return fetch_reserved_names(
+        IANA_RESERVED_URL, ["example", "invalid", "localhost", "test"]
+    )
 
 
 def update_icann_reserved():
     """
     Fetch ICANN reserved names.
-    For demo purposes, returns a fixed list.
+    For demo purposes, returns a fixed list unless ICANN_RESERVED_URL is set.
     """
-    return ["nic", "domain", "register", "registration"]
+    return fetch_reserved_names(
+        ICANN_RESERVED_URL, ["nic", "domain", "register", "registration"]
+    )
+
+
+RESERVED_EXTRA = frozenset(
+    {"admin", "support", "www", "mail", "ftp", "api", "demo", "test"}
+)
 
 
 def merge_reserved_lists():
-    reserved = set()
-    for name in update_iana_reserved():
-        reserved.add(name.lower())
-    for name in update_icann_reserved():
-        reserved.add(name.lower())
-    additional = {"admin", "support", "www", "mail", "ftp", "api", "demo", "test"}
-    return list(reserved.union(additional))
+    # Sorted so the saved file is stable across runs and diffs cleanly.
+    return sorted(
+        RESERVED_EXTRA
+        | {
+            name.casefold()
+            for name in (*update_iana_reserved(), *update_icann_reserved())
+        }
+    )
 
 
 def save_reserved_list(reserved_list):
@@ -43,9 +101,13 @@ def save_reserved_list(reserved_list):
         "last_updated": datetime.now(timezone.utc).isoformat(),
         "reserved": reserved_list,
     }
-    with open(RESERVED_FILE, "w") as f:
-        json.dump(data, f, indent=2)
-    logger.info(f"Saved {len(reserved_list)} reserved names to {RESERVED_FILE}")
+    if orjson:
+        with open(RESERVED_FILE, "wb") as f:
+            f.write(orjson.dumps(data))
+    else:
+        with open(RESERVED_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+    logger.info("Saved %s reserved names to %s", len(reserved_list), RESERVED_FILE)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,31 @@
 #!/usr/bin/env python3
+import asyncio
+import concurrent.futures
+import itertools
 import json
 import logging
 import os
-import time
+import re
 import sys
 import requests
 
-from generate_domains import generate_domains
-from check_domains import check_domains
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is used instead
+    orjson = None
+
+from generate_domains import (
+    generate_domains,
+    get_valid_tlds,
+    load_reserved_list,
+    write_domains,
+)
+from check_domains import check_domains_async
+
+# Matches "${VAR}" or "${VAR:-default}" config values.
+ENV_VAR_PATTERN = re.compile(
+    r"\A\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-(.*))?\}\Z", re.DOTALL
+)
 
 
 def load_config():
@@ -15,25 +33,35 @@ def load_config():
     Load configuration from config.json and resolve any environment variable placeholders.
     """
     try:
-        with open("config.json") as f:
-            config = json.load(f)
+        if orjson:
+            with open("config.json", "rb") as f:
+                config = orjson.loads(f.read())
+        else:
+            with open("config.json") as f:
+                config = json.load(f)
     except Exception as e:
         sys.exit(f"Error loading config.json: {e}")
 
-    def resolve(item):
-        if isinstance(item, dict):
-            return {k: resolve(v) for k, v in item.items()}
-        elif isinstance(item, list):
-            return [resolve(x) for x in item]
-        elif isinstance(item, str):
-            if item.startswith("${") and item.endswith("}"):
-                env_var = item[2:-1]
-                return os.environ.get(env_var, item)
-            return item
-        else:
-            return item
-
-    return resolve(config)
+    # Walk the tree with an explicit stack, substituting string leaves in place.
+    # JSON only yields exact built-in types, so nodes dispatch on type() with a
+    # dict probe rather than isinstance() checks.
+    children = {dict: dict.items, list: enumerate}
+    stack = [config] if type(config) in children else []
+    while stack:
+        node = stack.pop()
+        for key, value in children[type(node)](node):
+            kind = type(value)
+            if kind is str:
+                match = ENV_VAR_PATTERN.match(value)
+                if match:
+                    name, default = match.groups()
+                    if default is None:
+                        node[key] = os.environ.get(name, value)
+                    else:
+                        node[key] = os.environ.get(name) or default
+            elif kind in children:
+                stack.append(value)
+    return config
 
 
 # Load configuration (with env var resolution)
@@ -47,6 +75,10 @@ try:
     handlers.append(logging.FileHandler(LOG_FILE))
 except PermissionError as e:
     print(f"Warning: Unable to open log file {LOG_FILE}: {e}")
+# The log format uses no thread or process fields, so skip collecting them.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
@@ -55,29 +87,68 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def fetch_tld_list():
-    url = "https://data.iana.org/TLD/tlds-alpha-by-domain.txt"
-    try:
-        r = requests.get(url, timeout=10)
-        r.raise_for_status()
-        lines = r.text.splitlines()
-        tlds = [
-            line.strip().lower()
-            for line in lines
-            if line and not line.startswith("#") and len(line.strip()) == 2
-        ]
-        logger.info(f"Fetched {len(tlds)} two-letter TLDs from IANA.")
-        return tlds
-    except Exception as e:
-        logger.error(f"Error fetching TLD list: {e}")
-        return ["us", "uk", "ca", "de", "fr"]
+# Optional registrar bulk-availability endpoint; unset keeps per-domain checks.
+BULK_CHECK_URL = config.get("bulk_check_url", "")
+BULK_CHECK_API_KEY = config.get("bulk_check_api_key", "")
+BULK_BATCH_SIZE = config.get("bulk_batch_size", 500)
+
 
+def candidate_filter(min_sld, min_tld):
+    """
+    Return a predicate that is true for a single sld.tld pair meeting the
+    minimum lengths. The test is a compiled regex match, so filtering with
+    it runs in C rather than one Python call per candidate.
+    """
+    return re.compile(rf"[^.]{{{min_sld},}}\.[^.]{{{min_tld},}}").fullmatch
 
-def cache_fresh(file_path, max_age_days):
-    if os.path.exists(file_path):
-        age = time.time() - os.path.getmtime(file_path)
-        return (age / 86400) < max_age_days
-    return False
+
+def bulk_check(domains, batch_size=BULK_BATCH_SIZE):
+    """
+    Query BULK_CHECK_URL for domains, batch_size names per POST.
+    Returns {domain: True/False/None}; None marks names the API reported as
+    unknown or that were in a failed batch, to be checked per domain instead.
+    """
+    statuses = dict.fromkeys(domains)
+    headers = {"Authorization": BULK_CHECK_API_KEY} if BULK_CHECK_API_KEY else {}
+    it = iter(domains)
+    with requests.Session() as session:
+        while chunk := list(itertools.islice(it, batch_size)):
+            try:
+                r = session.post(
+                    BULK_CHECK_URL,
+                    json={"domains": chunk},
+                    headers=headers,
+                    timeout=30,
+                )
+                r.raise_for_status()
+                entries = r.json().get("domains", [])
+            except Exception as e:
+                logger.error("Bulk availability check failed: %s", e)
+                continue
+            for entry in entries:
+                domain = entry.get("domain")
+                if domain in statuses and entry.get("status") != "unknown":
+                    statuses[domain] = bool(entry.get("available"))
+    return statuses
+
+
+def check_candidates(domains):
+    """
+    Check domains, resolving as many as possible through the bulk endpoint
+    when one is configured and the rest through check_domains_async.
+    Returns a dict in the same shape as check_domains_async.
+    """
+    known = None
+    if BULK_CHECK_URL:
+        statuses = bulk_check(domains)
+        known = {d: status for d, status in statuses.items() if status is not None}
+        logger.info(
+            "Bulk API answered %s of %s domains; checking %s individually.",
+            len(known),
+            len(statuses),
+            len(statuses) - len(known),
+        )
+    return asyncio.run(check_domains_async(domains, known))
 
 
 def main():
@@ -85,62 +156,53 @@ def main():
     min_tld = config.get("min_tld_length", 2)
     min_sld = config.get("min_sld_length", 2)
 
-    # 1. TLD Cache: Check if tld_list.json is fresh
-    tld_cache_file = "tld_list.json"
-    if cache_fresh(tld_cache_file, max_cache_age_days):
-        logger.info("Using cached TLD list.")
-        try:
-            with open(tld_cache_file) as f:
-                tlds = json.load(f)
-        except Exception as e:
-            logger.error(f"Error reading TLD cache: {e}")
-            tlds = fetch_tld_list()
-            with open(tld_cache_file, "w") as f:
-                json.dump(tlds, f)
-    else:
-        logger.info("TLD cache is stale or missing; fetching new TLD list.")
-        tlds = fetch_tld_list()
-        with open(tld_cache_file, "w") as f:
-            json.dump(tlds, f)
+    # 1. TLD list: shared with generate_domains' cache, revalidated with a
+    # conditional GET once older than max_cache_age_days.
+    tlds = get_valid_tlds(max_cache_age_days * 86400)
 
-    # 2. Generate domain candidates.
+    # 2. Generate domain candidates in memory.
     domains_file = "output/generated_domains.txt"
     os.makedirs("output", exist_ok=True)
-    count = 0
-    with open(domains_file, "w", encoding="utf-8") as f:
-        for domain in generate_domains(
-            prefix_domain="",
-            prefix_tld="",
-            only_words=False,
-            valid_words_set=None,
-            reserved_set=None,
-            emoji_mode=False,
-        ):
-            parts = domain.split(".")
-            if len(parts) != 2:
-                continue
-            sld, tld = parts
-            if len(sld) < min_sld or len(tld) < min_tld:
-                continue
-            f.write(domain + "\n")
-            count += 1
-    logger.info(f"Generated {count} candidate domains and saved to {domains_file}")
-
-    # 3. Check domain availability.
-    try:
-        with open(domains_file, "r", encoding="utf-8") as f:
-            domains_list = [line.strip() for line in f if line.strip()]
-    except Exception as e:
-        logger.error(f"Error reading generated domains file: {e}")
-        sys.exit(1)
-    results = check_domains(domains_list)
+    reserved = load_reserved_list()
+    candidates = generate_domains(
+        prefix_domain="",
+        prefix_tld="",
+        only_words=False,
+        valid_words_set=None,
+        reserved_set=reserved,
+        emoji_mode=False,
+        tlds=tlds,
+    )
+    # Every candidate is a two-letter SLD on one of tlds, so when the TLD axis
+    # already meets the minimums (the 2/2 default) no per-candidate check is
+    # needed; otherwise fall back to the generic filter.
+    if min_sld > 2 or any(len(t) < min_tld or "." in t for t in tlds):
+        candidates = filter(candidate_filter(min_sld, min_tld), candidates)
+    domains_list = list(candidates)
+
+    # 3. Check domain availability while the candidate list is saved to disk
+    # in the background.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as writer:
+        write_future = writer.submit(write_domains, domains_file, domains_list)
+        results = check_candidates(domains_list)
+        try:
+            count = write_future.result()
+            logger.info(
+                "Generated %s candidate domains and saved to %s", count, domains_file
+            )
+        except OSError as e:
+            logger.error("Error writing generated domains file: %s", e)
     logger.info("Domain availability check completed.")
 
     # 4. Save overall results.
     results_file = "domain_results.json"
-    with open(results_file, "w") as f:
-        json.dump(results, f, indent=2)
-    logger.info(f"Results saved to {results_file}")
+    if orjson:
+        with open(results_file, "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(results_file, "w") as f:
+            json.dump(results, f, indent=2)
+    logger.info("Results saved to %s", results_file)
     print(results["summary"])
 
 